@@ -22,7 +22,7 @@ if __name__ == "__main__":
     book.add_record(jane_record)
 
     # Print all records in the book
-    for name, record in book.data.items():
+    for name, record in book.items():
         print(record)
 
     # Find and edit a phone number for John
@@ -32,8 +32,6 @@ if __name__ == "__main__":
 
     print(john)
     print(john.birthday)  # Output: Contact name: John, phones: 1112223333; 5555555555
-    john.edit_phone("5555555555", "1112223333")
-    print(john)
     # Find a specific phone number in John's record
     found_phone = john.find_phone("5555555555")
     print(f"{john.name}: {found_phone}")  # Output: 5555555555
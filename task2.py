@@ -123,11 +123,11 @@ def show_all(book: AddressBook) -> str:
     Returns:
         str: All contacts formatted as a string, or an error message if empty.
     """
-    if not book.data:
+    if not book:
         return "Sorry, your phone book is empty."
     else:
         all_contacts = ""
-        for name, phone in book.data.items():
+        for name, phone in book.items():
             all_contacts += f"{phone}\n"
         return all_contacts.strip()
 
@@ -186,7 +186,7 @@ def birthdays(book: AddressBook) -> str:
     upcoming = ""
     if upcoming_birthdays:
         for birthday in upcoming_birthdays:
-            upcoming += f"Name : {birthday['name']:<10} - congratulation_date: {birthday['congratulation_date']}\n"
+            upcoming += f"Name : {birthday.name:<10} - congratulation_date: {birthday.congratulation_date}\n"
         return upcoming
     return "No upcoming birthdays"
 
@@ -1,16 +1,129 @@
 """
 AddressBook
 """
-from datetime import datetime, timedelta
-from collections import UserDict
+from array import array
+from bisect import bisect_left, bisect_right
+from calendar import isleap
+from collections import UserDict, namedtuple
+from datetime import date
+from operator import itemgetter
+from typing import Iterable
+from task_1.fields import Birthday
 from task_1.record import Record
 
+# Upcoming birthday entry returned by AddressBook.get_upcoming_birthdays
+Upcoming = namedtuple("Upcoming", ["name", "congratulation_date"])
+
+# Days to move a birthday forward to the next Monday, indexed by weekday (Mon..Sun)
+_WEEKEND_SHIFT = (0, 0, 0, 0, 0, 2, 1)
+
+
+def _birthday_key(month: int, day: int) -> int:
+    """
+    Returns an integer that orders (month, day) pairs in calendar order.
+
+    Args:
+        month (int): The birthday month.
+        day (int): The birthday day of the month.
+
+    Returns:
+        int: The sort key, decoded back with divmod(key, 32).
+    """
+    return month * 32 + day
+
+
+def _birthday_ordinal(year: int, month: int, day: int) -> int:
+    """
+    Returns the ordinal of a birthday in the given year.
+
+    Birthdays on February 29 are celebrated on February 28 in non-leap years.
+
+    Args:
+        year (int): The year of the celebration.
+        month (int): The birthday month.
+        day (int): The birthday day of the month.
+
+    Returns:
+        int: The proleptic Gregorian ordinal of the celebration date.
+    """
+    if month == 2 and day == 29 and not isleap(year):
+        day = 28
+    return date(year, month, day).toordinal()
+
 
 class AddressBook(UserDict):
     """
     Class for storing and managing contact records. Inherits from UserDict.
+
+    Birthdays are also kept as a packed array of (month, day) keys sorted in
+    calendar order with a parallel list of names, so that get_upcoming_birthdays
+    only looks at the slice of keys that falls within the next week. Every
+    mutation goes through __setitem__ and __delitem__, which keep it in sync;
+    writing to the underlying data dict directly bypasses the cache.
     """
 
+    def __init__(self, *args, **kwargs):
+        """
+        Initializes the address book and its birthday cache.
+        """
+        self._bd_keys = array("H")
+        self._bd_names = []
+        self._bd_key_by_name = {}
+        self._bd_congrats = {}
+        self._keys_by_record = {}
+        super().__init__(*args, **kwargs)
+
+    def __setitem__(self, name: str, record: Record) -> None:
+        """
+        Stores a record under a name and updates the birthday cache.
+
+        Args:
+            name (str): The key of the record.
+            record (Record): The record to store.
+        """
+        old_record = self.data.get(name)
+        self.data[name] = record
+        if old_record is not None and old_record is not record:
+            self._release(name, old_record)
+        self._hold(name, record)
+        self._index_birthday(name, record)
+
+    def __delitem__(self, name: str) -> None:
+        """
+        Removes the record stored under a name and its birthday cache entry.
+
+        Args:
+            name (str): The key of the record.
+
+        Raises:
+            KeyError: If no record is stored under the name.
+        """
+        record = self.data.pop(name)
+        self._unindex_birthday(name)
+        self._release(name, record)
+
+    def __ior__(self, other) -> "AddressBook":
+        """
+        Merges records into the address book, keeping the birthday cache in sync.
+
+        Args:
+            other (Mapping[str, Record]): The records to merge, keyed by name.
+
+        Returns:
+            AddressBook: The updated address book.
+        """
+        self.update(other)
+        return self
+
+    def __copy__(self) -> "AddressBook":
+        """
+        Returns a shallow copy of the address book with its own birthday cache.
+
+        Returns:
+            AddressBook: The copied address book.
+        """
+        return type(self)(self.data)
+
     def add_record(self, record: Record) -> None:
         """
         Adds a record to the address book.
@@ -18,7 +131,26 @@ class AddressBook(UserDict):
         Args:
             record (Record): The record to add.
         """
-        self.data[record.name.value] = record
+        self[record.name.value] = record
+
+    def add_records(self, records: Iterable[Record]) -> None:
+        """
+        Adds several records to the address book in one batch.
+
+        The records are stored directly and the birthday cache is rebuilt with a
+        single sort afterwards instead of being updated record by record.
+
+        Args:
+            records (Iterable[Record]): The records to add.
+        """
+        for record in records:
+            name = record.name.value
+            old_record = self.data.get(name)
+            self.data[name] = record
+            if old_record is not None and old_record is not record:
+                self._release(name, old_record)
+            self._hold(name, record)
+        self._rebuild_birthday_index()
 
     def find(self, name: str) -> Record:
         """
@@ -30,7 +162,7 @@ class AddressBook(UserDict):
         Returns:
             Record: The record if found, or None.
         """
-        return self.data.get(name)
+        return self.get(name)
 
     def delete(self, name: str) -> None:
         """
@@ -40,39 +172,148 @@ class AddressBook(UserDict):
             name (str): The name of the record to delete.
         """
         if name in self.data:
-            del self.data[name]
+            del self[name]
 
-    def get_upcoming_birthdays(self) -> list[dict[str, str]]:
+    def birthday_changed(self, record: Record) -> None:
+        """
+        Refreshes the birthday cache after a record's birthday was added or changed.
+
+        Args:
+            record (Record): The record whose birthday changed.
+        """
+        for name in self._keys_by_record.get(id(record), ()):
+            self._index_birthday(name, record)
+
+    def _hold(self, name: str, record: Record) -> None:
+        """
+        Remembers that a record is stored under a name.
+
+        The first key holding a record subscribes the book to its birthday changes.
+
+        Args:
+            name (str): The key of the record in the address book.
+            record (Record): The record stored under that key.
+        """
+        keys = self._keys_by_record.get(id(record))
+        if keys is None:
+            keys = self._keys_by_record[id(record)] = set()
+            record.attach_book(self)
+        keys.add(name)
+
+    def _release(self, name: str, record: Record) -> None:
+        """
+        Forgets that a record is stored under a name.
+
+        The book unsubscribes once no key holds the record any more.
+
+        Args:
+            name (str): The key the record was removed from.
+            record (Record): The record that was removed or replaced.
+        """
+        keys = self._keys_by_record[id(record)]
+        keys.discard(name)
+        if not keys:
+            del self._keys_by_record[id(record)]
+            record.detach_book(self)
+
+    def _index_birthday(self, name: str, record: Record) -> None:
+        """
+        Updates the birthday cache entry stored under a name.
+
+        Args:
+            name (str): The key of the record in the address book.
+            record (Record): The record stored under that key.
+        """
+        self._unindex_birthday(name)
+        if record.birthday:
+            key = _birthday_key(record.birthday.month, record.birthday.day)
+            i = bisect_right(self._bd_keys, key)
+            self._bd_keys.insert(i, key)
+            self._bd_names.insert(i, name)
+            self._bd_key_by_name[name] = key
+
+    def _rebuild_birthday_index(self) -> None:
+        """
+        Rebuilds the birthday cache from all records in the address book.
+        """
+        entries = sorted(
+            (
+                (_birthday_key(record.birthday.month, record.birthday.day), name)
+                for name, record in self.data.items()
+                if record.birthday
+            ),
+            key=itemgetter(0),
+        )
+        self._bd_keys = array("H", [key for key, _ in entries])
+        self._bd_names = [name for _, name in entries]
+        self._bd_key_by_name = {name: key for key, name in entries}
+        self._bd_congrats.clear()
+
+    def _unindex_birthday(self, name: str) -> None:
+        """
+        Removes a name from the birthday cache if present.
+
+        Args:
+            name (str): The name of the record.
+        """
+        self._bd_congrats.pop(name, None)
+        key = self._bd_key_by_name.pop(name, None)
+        if key is not None:
+            i = self._bd_names.index(
+                name,
+                bisect_left(self._bd_keys, key),
+                bisect_right(self._bd_keys, key),
+            )
+            del self._bd_keys[i]
+            del self._bd_names[i]
+
+    def get_upcoming_birthdays(self) -> list[Upcoming]:
         """
         Returns a list of users with upcoming birthdays, including the congratulation date.
 
         Returns:
-            list[dict[str, str]]: List of users with upcoming birthdays.
+            list[Upcoming]: List of users with upcoming birthdays.
         """
         users_upcoming_birthday = []
-        today = datetime.today().date()
-        for user_name, user in self.data.items():
-            if user.birthday:
-                birthday_date = user.birthday.value
-
-                # Set the birthday to the current year
-                birthday_this_year = birthday_date.replace(year=today.year)
-
-                # If the birthday this year has already passed, set it to next year
-                if birthday_this_year < today:
-                    birthday_this_year = birthday_this_year.replace(year=today.year + 1)
-
-                # Check if the birthday is within the next 7 days
-                if 0 <= (birthday_this_year - today).days <= 7:
-                    # Adjust the birthday to avoid weekends
-                    while birthday_this_year.weekday() in [5, 6]:
-                        birthday_this_year += timedelta(days=1)
-                    users_upcoming_birthday.append(
-                        {
-                            "name": user_name,
-                            "congratulation_date": birthday_this_year.strftime(
-                                "%d.%m.%Y"
-                            ),
-                        }
+        today = date.today()
+        today_ord = today.toordinal()
+        end = date.fromordinal(today_ord + 7)
+        start_key = _birthday_key(today.month, today.day)
+        end_key = _birthday_key(end.month, end.day)
+
+        # February 29 birthdays are celebrated on February 28 in non-leap years
+        if end.month == 2 and end.day == 28 and not isleap(end.year):
+            end_key += 1
+
+        # Key ranges covering the next 7 days, split when the week crosses New Year
+        if start_key <= end_key:
+            ranges = ((start_key, end_key, today.year),)
+        else:
+            ranges = (
+                (start_key, _birthday_key(12, 31), today.year),
+                (_birthday_key(1, 1), end_key, today.year + 1),
+            )
+
+        for low, high, year in ranges:
+            for i in range(
+                bisect_left(self._bd_keys, low), bisect_right(self._bd_keys, high)
+            ):
+                user_name = self._bd_names[i]
+
+                # Reuse the congratulation date computed earlier today
+                cached = self._bd_congrats.get(user_name)
+                if cached is not None and cached[0] == today_ord:
+                    congratulation_date = cached[1]
+                else:
+                    month, day = divmod(self._bd_keys[i], 32)
+                    birthday_ord = _birthday_ordinal(year, month, day)
+                    # Adjust the birthday to avoid weekends; ordinal 1 is a Monday
+                    birthday_ord += _WEEKEND_SHIFT[(birthday_ord - 1) % 7]
+                    congratulation_date = Birthday.convert_date_to_str(
+                        date.fromordinal(birthday_ord)
                     )
+                    self._bd_congrats[user_name] = (today_ord, congratulation_date)
+                users_upcoming_birthday.append(
+                    Upcoming(user_name, congratulation_date)
+                )
         return users_upcoming_birthday
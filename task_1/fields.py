@@ -2,8 +2,7 @@
 Fields record in address book.
 """
 
-import re
-from datetime import datetime
+from datetime import date
 
 
 class PhoneNumberValueError(Exception):
@@ -14,6 +13,19 @@ class BirthdayValueError(Exception):
     pass
 
 
+def is_valid_phone(value: str) -> bool:
+    """
+    Checks that the phone number consists of exactly 10 ASCII digits.
+
+    Args:
+        value (str): The phone number.
+
+    Returns:
+        bool: True if the phone number is valid, otherwise False.
+    """
+    return len(value) == 10 and value.isascii() and value.isdigit()
+
+
 class Field:
     """
     Base class for storing field values of a record.
@@ -22,6 +34,8 @@ class Field:
         value (str): The value of the field.
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value: str):
         """
         Initializes the field.
@@ -46,36 +60,24 @@ class Name(Field):
     Class for storing a contact's name. Inherits from Field.
     """
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         return str(self.value)
 
 
-class Phone(Field):
-    """
-    Class for storing a phone number. Inherits from Field.
-    Validates the phone number format (10 digits).
-    """
-
-    def __init__(self, value: str):
-        """
-        Initializes the phone number with validation.
-
-        Args:
-            value (str): The phone number.
-
-        Raises:
-            ValueError: If the phone number does not match the format (10 digits).
-        """
-        if not re.fullmatch(r"\d{10}", value):
-            raise PhoneNumberValueError("Phone number must be 10 digits")
-        super().__init__(value)
-
-
 class Birthday(Field):
     """
     Class for storing and validating a birthday. Inherits from Field.
+
+    Attributes:
+        value (date): The birthday date.
+        month (int): The birthday month.
+        day (int): The birthday day of the month.
     """
 
+    __slots__ = ("month", "day")
+
     def __init__(self, value: str):
         """
         Initializes the birthday with validation.
@@ -84,28 +86,64 @@ class Birthday(Field):
             value (str): The birthday in the format "DD.MM.YYYY".
 
         Raises:
-            ValueError: If the birthday does not match the required format.
+            BirthdayValueError: If the birthday is not a valid DD.MM.YYYY date.
         """
-        if not re.fullmatch(r"\d{2}\.\d{2}\.\d{4}", value):
-            raise BirthdayValueError("Date must be in format: DD.MM.YYYY")
         try:
             birthday = self.convert_str_to_date(value)
-            super().__init__(birthday)
-        except ValueError as exc:
-            raise BirthdayValueError("Invalid date format. Use DD.MM.YYYY") from exc
+        except (ValueError, TypeError) as exc:
+            raise BirthdayValueError(
+                f"Invalid date '{value}'; expected DD.MM.YYYY"
+            ) from exc
+        super().__init__(birthday)
+        self.month = birthday.month
+        self.day = birthday.day
 
     @staticmethod
-    def convert_str_to_date(date: str) -> datetime.date:
+    def convert_str_to_date(date_str: str) -> date:
         """
         Convert date string to date object.
 
         Args:
-            date (str): The date string in the format "DD.MM.YYYY".
+            date_str (str): The date string in the format "DD.MM.YYYY".
+
+        Returns:
+            date: The corresponding date object.
+
+        Raises:
+            ValueError: If the string is not a valid date in the format "DD.MM.YYYY".
+        """
+        if (
+            len(date_str) != 10
+            or date_str[2] != "."
+            or date_str[5] != "."
+            or not date_str.isascii()
+            or not (date_str[:2] + date_str[3:5] + date_str[6:]).isdigit()
+        ):
+            raise ValueError(f"Date must be in format: DD.MM.YYYY, got {date_str!r}")
+        # Decode the ASCII digits directly; date() still validates the ranges
+        day = (ord(date_str[0]) - 48) * 10 + ord(date_str[1]) - 48
+        month = (ord(date_str[3]) - 48) * 10 + ord(date_str[4]) - 48
+        year = (
+            (ord(date_str[6]) - 48) * 1000
+            + (ord(date_str[7]) - 48) * 100
+            + (ord(date_str[8]) - 48) * 10
+            + ord(date_str[9])
+            - 48
+        )
+        return date(year, month, day)
+
+    @staticmethod
+    def convert_date_to_str(value: date) -> str:
+        """
+        Convert date object to date string.
+
+        Args:
+            value (date): The date to format.
 
         Returns:
-            datetime.date: The corresponding date object.
+            str: The date in the format "DD.MM.YYYY".
         """
-        return datetime.strptime(date, "%d.%m.%Y").date()
+        return f"{value.day:02d}.{value.month:02d}.{value.year:04d}"
 
     def __str__(self) -> str:
         """
@@ -114,4 +152,4 @@ class Birthday(Field):
         Returns:
             str: The birthday in the format "DD.MM.YYYY".
         """
-        return f"Birthday: {self.value.strftime('%d.%m.%Y')}"
+        return f"Birthday: {self.convert_date_to_str(self.value)}"
@@ -2,8 +2,10 @@
 class Record
 """
 
-import re
-from task_1.fields import Name, Birthday, Phone, PhoneNumberValueError
+import weakref
+from typing import KeysView
+
+from task_1.fields import Name, Birthday, PhoneNumberValueError, is_valid_phone
 
 
 class Record:
@@ -12,10 +14,19 @@ class Record:
 
     Attributes:
         name (Name): The contact's name.
-        phones (list of Phone): The contact's phone numbers.
+        phones (KeysView of str): Read-only view of the contact's phone numbers.
         birthday (Birthday): The contact's birthday.
     """
 
+    __slots__ = (
+        "name",
+        "_phones",
+        "_birthday",
+        "_books",
+        "_phones_str",
+        "_phones_dirty",
+    )
+
     def __init__(self, name: str):
         """
         Initializes the record with the contact's name.
@@ -24,8 +35,11 @@ class Record:
             name (str): The contact's name.
         """
         self.name = Name(name)
-        self.phones = []
-        self.birthday = None
+        self._phones = {}
+        self._birthday = None
+        self._books = []
+        self._phones_str = ""
+        self._phones_dirty = True
 
     def add_birthday(self, birthday: str) -> None:
         """
@@ -36,6 +50,62 @@ class Record:
         """
         self.birthday = Birthday(birthday)
 
+    @property
+    def birthday(self) -> Birthday:
+        """
+        Returns the contact's birthday.
+
+        Returns:
+            Birthday: The birthday, or None if not set.
+        """
+        return self._birthday
+
+    @birthday.setter
+    def birthday(self, birthday: Birthday) -> None:
+        """
+        Sets the contact's birthday and notifies the address books storing the record.
+
+        Args:
+            birthday (Birthday): The new birthday, or None to clear it.
+        """
+        self._birthday = birthday
+        for book_ref in self._books:
+            book = book_ref()
+            if book is not None:
+                book.birthday_changed(self)
+
+    def attach_book(self, book) -> None:
+        """
+        Subscribes an address book to changes of this record's birthday.
+
+        Args:
+            book (AddressBook): The address book that stores the record.
+        """
+        if not any(book_ref() is book for book_ref in self._books):
+            self._books.append(weakref.ref(book))
+
+    def detach_book(self, book) -> None:
+        """
+        Unsubscribes an address book from changes of this record's birthday.
+
+        Args:
+            book (AddressBook): The address book that no longer stores the record.
+        """
+        self._books = [book_ref for book_ref in self._books if book_ref() is not book]
+
+    @property
+    def phones(self) -> KeysView:
+        """
+        Returns the contact's phone numbers in the order they were added.
+
+        The view is read-only; use add_phone, remove_phone and edit_phone to change
+        the numbers so the cached string representation stays correct.
+
+        Returns:
+            KeysView: The phone numbers.
+        """
+        return self._phones.keys()
+
     def add_phone(self, phone_number: str) -> None:
         """
         Adds a phone number to the record.
@@ -43,7 +113,10 @@ class Record:
         Args:
             phone_number (str): The phone number to add.
         """
-        self.phones.append(Phone(phone_number))
+        if not is_valid_phone(phone_number):
+            raise PhoneNumberValueError("Phone number must be 10 digits")
+        self._phones[phone_number] = None
+        self._phones_dirty = True
 
     def remove_phone(self, phone_number: str) -> None:
         """
@@ -52,9 +125,9 @@ class Record:
         Args:
             phone_number (str): The phone number to remove.
         """
-        phone_to_remove = self.find_phone(phone_number)
-        if phone_to_remove:
-            self.phones.remove(phone_to_remove)
+        if phone_number in self._phones:
+            del self._phones[phone_number]
+            self._phones_dirty = True
 
     def edit_phone(self, old_number: str, new_number: str) -> None:
         """
@@ -63,16 +136,26 @@ class Record:
         Args:
             old_number (str): The old phone number.
             new_number (str): The new phone number.
+
+        Raises:
+            PhoneNumberValueError: If the old number is not in the record, the new
+                number is not 10 digits, or the new number is already in the record.
         """
-        phone_to_edit = self.find_phone(old_number)
-        if phone_to_edit:
-            if not re.fullmatch(r"\d{10}", new_number):
-                raise PhoneNumberValueError("Phone number must be 10 digits")
-            phone_to_edit.value = new_number
-        else:
+        if old_number not in self._phones:
             raise PhoneNumberValueError("Phone number not found")
-
-    def find_phone(self, phone_number: str) -> Phone:
+        if not is_valid_phone(new_number):
+            raise PhoneNumberValueError("Phone number must be 10 digits")
+        if new_number != old_number and new_number in self._phones:
+            raise PhoneNumberValueError("Phone number already exists")
+        # Rebuild the dict so the edited number keeps its display position; this is
+        # linear in the record's own phones, not in the size of the address book
+        self._phones = {
+            new_number if number == old_number else number: None
+            for number in self._phones
+        }
+        self._phones_dirty = True
+
+    def find_phone(self, phone_number: str) -> str:
         """
         Finds a phone number in the record.
 
@@ -80,12 +163,9 @@ class Record:
             phone_number (str): The phone number to find.
 
         Returns:
-            Phone: The phone number if found, or None.
+            str: The phone number if found, or None.
         """
-        for phone in self.phones:
-            if phone.value == phone_number:
-                return phone
-        return None
+        return phone_number if phone_number in self._phones else None
 
     def __str__(self) -> str:
         """
@@ -94,6 +174,11 @@ class Record:
         Returns:
             str: The string representation of the record.
         """
-        phone_list = "; ".join(p.value for p in self.phones)
+        if self._phones_dirty:
+            self._phones_str = "; ".join(self._phones)
+            self._phones_dirty = False
         birthday_str = f", {self.birthday}" if self.birthday else ""
-        return f"Contact name: {self.name.value:<10}| phones: {phone_list}{birthday_str}"
+        return (
+            f"Contact name: {self.name.value:<10}| phones: {self._phones_str}"
+            f"{birthday_str}"
+        )